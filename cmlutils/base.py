@@ -1,12 +1,55 @@
+import functools
 import os
 import shutil
+import time
 from datetime import datetime, timedelta
 from string import Template
 
-from cmlutils.constants import ApiV1Endpoints
+from cmlutils.constants import API_READ_CACHE_TTL_SECONDS, ApiV1Endpoints
 from cmlutils.utils import call_api_v1
 
 
+def cached_read(resource: str):
+    """
+    Memoize a read-only API call on the interactor for
+    API_READ_CACHE_TTL_SECONDS, keyed by the resource type and call arguments.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (resource, method.__name__, args, tuple(sorted(kwargs.items())))
+            entry = self._read_cache.get(key)
+            now = time.monotonic()
+            if entry is not None and now - entry[0] < API_READ_CACHE_TTL_SECONDS:
+                return entry[1]
+            result = method(self, *args, **kwargs)
+            self._read_cache[key] = (now, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates_reads(resource: str):
+    """Drop cached reads of the resource type once a write to it succeeds."""
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            self._read_cache = {
+                key: entry
+                for key, entry in self._read_cache.items()
+                if key[0] != resource
+            }
+            return result
+
+        return wrapper
+
+    return decorator
+
 
 class BaseWorkspaceInteractor(object):
     def __init__(
@@ -26,6 +69,7 @@ class BaseWorkspaceInteractor(object):
         self.ca_path = ca_path
         self.project_slug = project_slug
         self._apiv2_key = apiv2_key  # V2 API key (may be None)
+        self._read_cache = {}  # Used by the cached_read/invalidates_reads decorators
 
     @property
     def apiv2_key(self) -> str:
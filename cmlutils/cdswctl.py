@@ -9,7 +9,7 @@ from pathlib import Path
 from sys import platform
 
 from cmlutils import constants
-from cmlutils.utils import download_file
+from cmlutils.utils import download_file, is_ssl_verification_disabled
 
 
 def _get_cdswctl_download_url(host: str) -> str:
@@ -65,7 +65,7 @@ def cdswctl_login(cdswctl_path: str, host: str, username: str, api_key: str, ca_
     cmd = [cdswctl_path, "login", "-n", username, "-u", host, "-y", api_key]
     
     # Add insecure flag if SSL verification is disabled
-    if ca_path.lower() == "false":
+    if is_ssl_verification_disabled(ca_path):
         cmd.append("--insecure-skip-verify")
         logging.debug("Added --insecure-skip-verify flag to cdswctl login command")
     
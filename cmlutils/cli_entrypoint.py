@@ -16,3 +16,7 @@ cli.add_command(project_helpers_cmd)
 
 def main():
     cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 """This module defines project-level constants."""
 
+import re
 from enum import Enum
 
 CDSW_PROJECTS_ROOT_DIR = "cdsw@localhost:/home/cdsw/"
@@ -23,6 +24,7 @@ SOURCE_DIR_KEY = "source_dir"
 PROJECT_NAME_KEY = "project_name"
 CA_PATH_KEY = "ca_path"
 MAX_API_PAGE_LENGTH = 30
+API_READ_CACHE_TTL_SECONDS = 30
 
 
 class ApiV2Endpoints(Enum):
@@ -40,11 +42,22 @@ class ApiV2Endpoints(Enum):
     APPS_LIST = "/api/v2/projects/$project_id/applications"
     SEARCH_PROJECT = "/api/v2/projects?search_filter=$search_option&include_public_projects=true&page_size=100000"
     SEARCH_MODEL = "/api/v2/projects/$project_id/models?search_filter=$search_option&page_size=100000"
-    SEARCH_JOB = "/api/v2/projects/$project_id/jobs?search_filter=$search_option&page_size=100000"
+    ALL_JOBS_LIST = "/api/v2/projects/$project_id/jobs?page_size=$page_size&page_token=$page_token"
     SEARCH_APP = "/api/v2/projects/$project_id/applications?search_filter=$search_option&page_size=100000"
     RUNTIME_ADDONS = "/api/v2/runtimeaddons?search_filter=$search_option"
     RUNTIMES = "/api/v2/runtimes?page_size=$page_size&page_token=$page_token"
 
+    def substitute(self, **kwargs) -> str:
+        """Fill in the $placeholders, like string.Template(value).substitute()."""
+        return _API_V2_ENDPOINT_FORMATS[self].format_map(kwargs)
+
+
+# ApiV2Endpoints paths converted once to str.format patterns, so building an
+# endpoint does not run string.Template's regex on every API call.
+_API_V2_ENDPOINT_FORMATS = {
+    endpoint: re.sub(r"\$(\w+)", r"{\1}", endpoint.value) for endpoint in ApiV2Endpoints
+}
+
 
 class ApiV1Endpoints(Enum):
     PROJECT = "api/v1/projects/$username/$project_name"
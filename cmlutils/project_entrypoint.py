@@ -4,7 +4,6 @@ import sys
 import time
 from configparser import ConfigParser, NoOptionError
 from json import dump
-import json
 from logging.handlers import RotatingFileHandler
 
 import click
@@ -428,8 +427,7 @@ def project_import_cmd(project_name, verify, verbose):
             _configure_project_command_logging(log_filedir, project_name, verbose)
 
             import_file = log_filedir + constants.IMPORT_METRIC_FILE
-            with open(import_file, 'r') as file:
-                validation_data = json.load(file)
+            validation_data = read_json_file(import_file)
             try:
                 # Get username of the creator of project - This is required so that admins can also migrate the project
                 pobj = ProjectExporter(
@@ -699,8 +697,7 @@ def project_verify_cmd(project_name, verbose):
     logging.info("Started Verifying project: %s", project_name)
     import_file = log_filedir + constants.IMPORT_METRIC_FILE
     try:
-        with open(import_file, 'r') as file:
-            validation_data = json.load(file)
+        validation_data = read_json_file(import_file)
     except:
         logging.error("File not found Exception: ", exc_info=1)
     try:
@@ -1,11 +1,11 @@
 import json
 import logging
+import operator
 import os
 import signal
 import subprocess
 import urllib.parse
 from datetime import datetime, timedelta
-from encodings import utf_8
 from string import Template
 from sys import stdout
 from typing import Any
@@ -13,7 +13,7 @@ from typing import Any
 from requests import HTTPError  # pyright: ignore[reportMissingModuleSource]
 
 from cmlutils import constants, legacy_engine_runtime_constants
-from cmlutils.base import BaseWorkspaceInteractor
+from cmlutils.base import BaseWorkspaceInteractor, cached_read, invalidates_reads
 from cmlutils.cdswctl import cdswctl_login, obtain_cdswctl
 from cmlutils.constants import ApiV1Endpoints, ApiV2Endpoints
 from cmlutils.directory_utils import (
@@ -26,16 +26,31 @@ from cmlutils.directory_utils import (
 )
 from cmlutils.ssh import open_ssh_endpoint
 from cmlutils.utils import (
+    build_runtime_index,
     call_api_v1,
     call_api_v2,
+    call_api_v2_many,
+    canonicalize_runtimes,
     extract_fields,
-    find_runtime,
+    find_runtime_indexed,
     flatten_json_data,
     get_best_runtime,
+    get_error_message,
+    make_field_extractor,
     read_json_file,
     write_json_file,
 )
 
+_extract_job_fields = make_field_extractor(constants.JOB_MAP)
+_extract_application_fields = make_field_extractor(constants.APPLICATION_MAPV2)
+_get_job_name_and_script = operator.itemgetter("name", "script")
+_get_runtime_match_fields = operator.itemgetter(
+    "runtime_edition",
+    "runtime_editor",
+    "runtime_kernel",
+    "runtime_shortversion",
+    "runtime_fullversion",
+)
 
 
 def is_project_configured_with_runtimes(
@@ -68,7 +83,7 @@ def is_project_configured_with_runtimes(
     # Search for the project using V2 API
     search_option = {"name": project_name}
     encoded_option = urllib.parse.quote(json.dumps(search_option).replace('"', '"'))
-    endpoint = Template(ApiV2Endpoints.SEARCH_PROJECT.value).substitute(
+    endpoint = ApiV2Endpoints.SEARCH_PROJECT.substitute(
         search_option=encoded_option
     )
     response = call_api_v2(
@@ -111,7 +126,7 @@ def get_ignore_files(
         with open(
             os.path.join(top_level_dir, project_name, constants.IGNORE_FILE_PATH),
             "w",
-            encoding=utf_8.getregentry().name,
+            encoding="utf-8",
         ) as f:
             f.writelines(a.strip())
         # Set file permissions to 600 (read and write only for the owner)
@@ -143,7 +158,7 @@ def get_ignore_files(
             with open(
                 os.path.join(top_level_dir, project_name, constants.IGNORE_FILE_PATH),
                 "w",
-                encoding=utf_8.getregentry().name,
+                encoding="utf-8",
             ) as f:
                 f.writelines(entries_content.strip())
             # Set file permissions to 600 (read and write only for the owner)
@@ -355,11 +370,12 @@ class ProjectExporter(BaseWorkspaceInteractor):
         self.metrics_data = dict()
 
     # Get CDSW project info using API v2
+    @cached_read("project")
     def get_project_infov2(self, project_id: str = None):
         if project_id is None:
             # First get the project ID by searching for the project
             project_id = self._get_project_id_by_name()
-        endpoint = Template(ApiV2Endpoints.GET_PROJECT.value).substitute(
+        endpoint = ApiV2Endpoints.GET_PROJECT.substitute(
             project_id=project_id
         )
         response = call_api_v2(
@@ -380,7 +396,7 @@ class ProjectExporter(BaseWorkspaceInteractor):
         encoded_option = urllib.parse.quote(
             json.dumps(search_option).replace('"', '"')
         )
-        endpoint = Template(ApiV2Endpoints.SEARCH_PROJECT.value).substitute(
+        endpoint = ApiV2Endpoints.SEARCH_PROJECT.substitute(
             search_option=encoded_option
         )
         response = call_api_v2(
@@ -439,7 +455,7 @@ class ProjectExporter(BaseWorkspaceInteractor):
         encoded_option = urllib.parse.quote(
             json.dumps(search_option).replace('"', '"')
         )
-        endpoint = Template(ApiV2Endpoints.SEARCH_PROJECT.value).substitute(
+        endpoint = ApiV2Endpoints.SEARCH_PROJECT.substitute(
             search_option=encoded_option
         )
         response = call_api_v2(
@@ -477,7 +493,7 @@ class ProjectExporter(BaseWorkspaceInteractor):
 
     # Get all models list info using API v2
     def get_models_listv2(self, project_id: str):
-        endpoint = Template(ApiV2Endpoints.MODELS_LIST.value).substitute(
+        endpoint = ApiV2Endpoints.MODELS_LIST.substitute(
             project_id=project_id
         )
         response = call_api_v2(
@@ -490,8 +506,9 @@ class ProjectExporter(BaseWorkspaceInteractor):
         return response.json().get("models", [])
 
     # Get all jobs list info using API v2
+    @cached_read("jobs")
     def get_jobs_listv2(self, project_id: str):
-        endpoint = Template(ApiV2Endpoints.JOBS_LIST.value).substitute(
+        endpoint = ApiV2Endpoints.JOBS_LIST.substitute(
             project_id=project_id
         )
         response = call_api_v2(
@@ -504,8 +521,9 @@ class ProjectExporter(BaseWorkspaceInteractor):
         return response.json().get("jobs", [])
 
     # Get all applications list info using API v2
+    @cached_read("applications")
     def get_app_listv2(self, project_id: str):
-        endpoint = Template(ApiV2Endpoints.APPS_LIST.value).substitute(
+        endpoint = ApiV2Endpoints.APPS_LIST.substitute(
             project_id=project_id
         )
         response = call_api_v2(
@@ -519,7 +537,7 @@ class ProjectExporter(BaseWorkspaceInteractor):
 
     # Get CDSW model info using API v2
     def get_model_infov2(self, project_id: str, model_id: str):
-        endpoint = Template(ApiV2Endpoints.BUILD_MODEL.value).substitute(
+        endpoint = ApiV2Endpoints.BUILD_MODEL.substitute(
             project_id=project_id, model_id=model_id
         )
         response = call_api_v2(
@@ -531,6 +549,23 @@ class ProjectExporter(BaseWorkspaceInteractor):
         )
         return response.json()
 
+    def get_model_infos_v2(self, project_id: str, model_ids):
+        """Fetch several models' details concurrently, in model_ids order."""
+        endpoints = [
+            ApiV2Endpoints.BUILD_MODEL.substitute(
+                project_id=project_id, model_id=model_id
+            )
+            for model_id in model_ids
+        ]
+        responses = call_api_v2_many(
+            host=self.host,
+            endpoints=endpoints,
+            method="GET",
+            user_token=self.apiv2_key,
+            ca_path=self.ca_path,
+        )
+        return [response.json() for response in responses]
+
     # Get current user info
     def get_current_user_info(self):
         """Get the user information - we already have the username"""
@@ -538,6 +573,7 @@ class ProjectExporter(BaseWorkspaceInteractor):
         return {"username": self.username}
 
     # Update project owner using V2 API
+    @invalidates_reads("project")
     def update_project_owner(self, project_id: str, new_owner_username: str):
         """
         Update the project owner using V2 API PATCH endpoint
@@ -546,7 +582,7 @@ class ProjectExporter(BaseWorkspaceInteractor):
             project_id: The project ID
             new_owner_username: The username of the new owner
         """
-        endpoint = Template(ApiV2Endpoints.UPDATE_PROJECT.value).substitute(
+        endpoint = ApiV2Endpoints.UPDATE_PROJECT.substitute(
             project_id=project_id
         )
         json_data = {
@@ -618,13 +654,14 @@ class ProjectExporter(BaseWorkspaceInteractor):
             logging.debug("No original owner cached, skipping restoration")
 
     # Get all runtimes using API v2
+    @cached_read("runtimes")
     def get_all_runtimes(self):
         """Get all runtimes using V2 API with pagination"""
         all_runtimes = []
         page_token = ""
         
         while True:
-            endpoint = Template(ApiV2Endpoints.RUNTIMES.value).substitute(
+            endpoint = ApiV2Endpoints.RUNTIMES.substitute(
                 page_size=1000, page_token=page_token
             )
             response = call_api_v2(
@@ -642,7 +679,7 @@ class ProjectExporter(BaseWorkspaceInteractor):
             if not page_token:
                 break
         
-        return {"runtimes": all_runtimes}
+        return {"runtimes": canonicalize_runtimes(all_runtimes)}
 
     def terminate_ssh_session(self):
         logging.info("Terminating ssh connection.")
@@ -865,10 +902,14 @@ class ProjectExporter(BaseWorkspaceInteractor):
         elif verbose:
             logging.debug("Found %d models in project %s", len(model_list), self.project_name)
         runtime_list = self.get_all_runtimes()
+        runtime_index = build_runtime_index(runtime_list.get("runtimes", []))
         model_metadata_list = []
-        for model in model_list:
-            # Get detailed model info including builds
-            model_details = self.get_model_infov2(project_id=self.project_id, model_id=model["id"])
+        # Get detailed model info including builds, for all models at once
+        model_details_list = self.get_model_infos_v2(
+            project_id=self.project_id,
+            model_ids=[model["id"] for model in model_list],
+        )
+        for model, model_details in zip(model_list, model_details_list):
             
             model_metadata = {
                 "name": model.get("name", ""),
@@ -887,9 +928,8 @@ class ProjectExporter(BaseWorkspaceInteractor):
                 model_metadata.update(build_metadata)
                 
                 if "runtime_id" in build_info_flatten:
-                    runtime_obj = find_runtime(
-                        runtime_list=runtime_list["runtimes"],
-                        runtime_id=build_info_flatten["runtime_id"],
+                    runtime_obj = find_runtime_indexed(
+                        runtime_index, build_info_flatten["runtime_id"]
                     )
                     if runtime_obj != None:
                         model_metadata.update(runtime_obj)
@@ -1092,6 +1132,9 @@ print("Please update the application script path in CML UI")
         if len(job_list) == 0:
             logging.info("Jobs are not present in the project %s.", self.project_name)
         runtime_list = self.get_all_runtimes()
+        runtimes = runtime_list.get("runtimes", [])
+        runtime_index = build_runtime_index(runtimes)
+        runtime_image_index = build_runtime_index(runtimes, key="image_identifier")
         job_metadata_list = []
         job_name_list = []
 
@@ -1107,17 +1150,16 @@ print("Please update the application script path in CML UI")
             if runtime_identifier:
                 # Find the runtime details by image_identifier to get full metadata
                 runtime_obj = None
-                for runtime in runtime_list.get("runtimes", []):
-                    if runtime.get("image_identifier") == runtime_identifier:
-                        # Extract runtime details for import fallback matching
-                        runtime_obj = {
-                            "runtime_kernel": runtime.get("kernel"),
-                            "runtime_edition": runtime.get("edition"),
-                            "runtime_editor": runtime.get("editor"),
-                            "runtime_fullversion": runtime.get("full_version"),
-                            "runtime_shortversion": runtime.get("short_version"),
-                        }
-                        break
+                runtime = runtime_image_index.get(runtime_identifier)
+                if runtime is not None:
+                    # Extract runtime details for import fallback matching
+                    runtime_obj = {
+                        "runtime_kernel": runtime.get("kernel"),
+                        "runtime_edition": runtime.get("edition"),
+                        "runtime_editor": runtime.get("editor"),
+                        "runtime_fullversion": runtime.get("full_version"),
+                        "runtime_shortversion": runtime.get("short_version"),
+                    }
                 
                 if runtime_obj:
                     job_metadata.update(runtime_obj)
@@ -1128,10 +1170,7 @@ print("Please update the application script path in CML UI")
             # V1 API: Check for runtime ID (legacy approach)
             elif "runtime.id" in job_info_flatten or "runtime_id" in job_info_flatten:
                 runtime_id = job_info_flatten.get("runtime.id") or job_info_flatten.get("runtime_id")
-                runtime_obj = find_runtime(
-                    runtime_list=runtime_list["runtimes"],
-                    runtime_id=runtime_id,
-                )
+                runtime_obj = find_runtime_indexed(runtime_index, runtime_id)
                 if runtime_obj != None:
                     job_metadata.update(runtime_obj)
                 else:
@@ -1247,7 +1286,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
         encoded_option = urllib.parse.quote(
             json.dumps(search_option).replace('"', '"')
         )
-        endpoint = Template(ApiV2Endpoints.SEARCH_PROJECT.value).substitute(
+        endpoint = ApiV2Endpoints.SEARCH_PROJECT.substitute(
             search_option=encoded_option
         )
         response = call_api_v2(
@@ -1494,6 +1533,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
             logging.error(f"Error: {e}")
             raise
 
+    @invalidates_reads("project")
     def convert_project_to_engine_based(self, proj_patch_metadata) -> bool:
         try:
             endpoint2 = Template(ApiV1Endpoints.PROJECT.value).substitute(
@@ -1514,7 +1554,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
 
     def create_model_v2(self, proj_id: str, model_metadata) -> str:
         try:
-            endpoint = Template(ApiV2Endpoints.CREATE_MODEL.value).substitute(
+            endpoint = ApiV2Endpoints.CREATE_MODEL.substitute(
                 project_id=proj_id
             )
             response = call_api_v2(
@@ -1534,7 +1574,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
     def create_model_build_v2(
         self, proj_id: str, model_id: str, model_metadata
     ) -> None:
-        endpoint = Template(ApiV2Endpoints.BUILD_MODEL.value).substitute(
+        endpoint = ApiV2Endpoints.BUILD_MODEL.substitute(
             project_id=proj_id, model_id=model_id
         )
         response = call_api_v2(
@@ -1547,9 +1587,10 @@ class ProjectImporter(BaseWorkspaceInteractor):
         )
         return
 
+    @invalidates_reads("applications")
     def create_application_v2(self, proj_id: str, app_metadata) -> str:
         try:
-            endpoint = Template(ApiV2Endpoints.CREATE_APP.value).substitute(
+            endpoint = ApiV2Endpoints.CREATE_APP.substitute(
                 project_id=proj_id
             )
             response = call_api_v2(
@@ -1566,8 +1607,9 @@ class ProjectImporter(BaseWorkspaceInteractor):
             logging.error(f"Error: {e}")
             raise
 
+    @invalidates_reads("applications")
     def stop_application_v2(self, proj_id: str, app_id: str) -> None:
-        endpoint = Template(ApiV2Endpoints.STOP_APP.value).substitute(
+        endpoint = ApiV2Endpoints.STOP_APP.substitute(
             project_id=proj_id, application_id=app_id
         )
         response = call_api_v2(
@@ -1579,9 +1621,10 @@ class ProjectImporter(BaseWorkspaceInteractor):
         )
         return
 
+    @invalidates_reads("jobs")
     def create_job_v2(self, proj_id: str, job_metadata) -> str:
         try:
-            endpoint = Template(ApiV2Endpoints.CREATE_JOB.value).substitute(
+            endpoint = ApiV2Endpoints.CREATE_JOB.substitute(
                 project_id=proj_id
             )
             response = call_api_v2(
@@ -1598,8 +1641,9 @@ class ProjectImporter(BaseWorkspaceInteractor):
             logging.error(f"Error: {e}")
             raise
 
+    @invalidates_reads("jobs")
     def update_job_v2(self, proj_id: str, job_id: str, job_metadata) -> None:
-        endpoint = Template(ApiV2Endpoints.UPDATE_JOB.value).substitute(
+        endpoint = ApiV2Endpoints.UPDATE_JOB.substitute(
             project_id=proj_id, job_id=job_id
         )
         response = call_api_v2(
@@ -1613,13 +1657,14 @@ class ProjectImporter(BaseWorkspaceInteractor):
         return
 
     # Get all runtimes using API v2
+    @cached_read("runtimes")
     def get_all_runtimes(self):
         """Get all runtimes using V2 API with pagination"""
         all_runtimes = []
         page_token = ""
         
         while True:
-            endpoint = Template(ApiV2Endpoints.RUNTIMES.value).substitute(
+            endpoint = ApiV2Endpoints.RUNTIMES.substitute(
                 page_size=1000, page_token=page_token
             )
             response = call_api_v2(
@@ -1637,13 +1682,13 @@ class ProjectImporter(BaseWorkspaceInteractor):
             if not page_token:
                 break
         
-        return {"runtimes": all_runtimes}
+        return {"runtimes": canonicalize_runtimes(all_runtimes)}
 
     # Get spark runtime addons using API v2
     def get_spark_runtimeaddons(self):
         search_option = {"identifier": constants.SPARK_ADDON, "status": "AVAILABLE"}
         encoded_option = urllib.parse.quote(json.dumps(search_option).replace('"', '"'))
-        endpoint = Template(ApiV2Endpoints.RUNTIME_ADDONS.value).substitute(
+        endpoint = ApiV2Endpoints.RUNTIME_ADDONS.substitute(
             search_option=encoded_option
         )
         response = call_api_v2(
@@ -1659,7 +1704,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
         return None
 
     def get_all_runtimes_v2(self, page_token=""):
-        endpoint = Template(ApiV2Endpoints.RUNTIMES.value).substitute(
+        endpoint = ApiV2Endpoints.RUNTIMES.substitute(
             page_size=constants.MAX_API_PAGE_LENGTH, page_token=page_token
         )
 
@@ -1681,7 +1726,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
             encoded_option = urllib.parse.quote(
                 json.dumps(search_option).replace('"', '"')
             )
-            endpoint = Template(ApiV2Endpoints.SEARCH_PROJECT.value).substitute(
+            endpoint = ApiV2Endpoints.SEARCH_PROJECT.substitute(
                 search_option=encoded_option
             )
             response = call_api_v2(
@@ -1707,7 +1752,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
             encoded_option = urllib.parse.quote(
                 json.dumps(search_option).replace('"', '"')
             )
-            endpoint = Template(ApiV2Endpoints.SEARCH_MODEL.value).substitute(
+            endpoint = ApiV2Endpoints.SEARCH_MODEL.substitute(
                 project_id=proj_id, search_option=encoded_option
             )
             response = call_api_v2(
@@ -1727,14 +1772,16 @@ class ProjectImporter(BaseWorkspaceInteractor):
             logging.error(f"Error: {e}")
             raise
 
-    def check_job_exist(self, job_name: str, script: str, proj_id: str) -> str:
-        try:
-            search_option = {"name": job_name, "script": script}
-            encoded_option = urllib.parse.quote(
-                json.dumps(search_option).replace('"', '"')
-            )
-            endpoint = Template(ApiV2Endpoints.SEARCH_JOB.value).substitute(
-                project_id=proj_id, search_option=encoded_option
+    def get_existing_job_ids(self, proj_id: str) -> dict:
+        """
+        Map (job name, script) to job ID for every job already in the project,
+        so job creation can check for existing jobs without a search per job.
+        """
+        existing_job_ids = {}
+        page_token = ""
+        while True:
+            endpoint = ApiV2Endpoints.ALL_JOBS_LIST.substitute(
+                project_id=proj_id, page_size=1000, page_token=page_token
             )
             response = call_api_v2(
                 host=self.host,
@@ -1743,15 +1790,14 @@ class ProjectImporter(BaseWorkspaceInteractor):
                 user_token=self.apiv2_key,
                 ca_path=self.ca_path,
             )
-            job_list = response.json()["jobs"]
-            if job_list:
-                for job in job_list:
-                    if job["name"] == job_name and job["script"] == script:
-                        return job["id"]
-            return None
-        except KeyError as e:
-            logging.error(f"Error: {e}")
-            raise
+            result = response.json()
+            for job in result.get("jobs", []):
+                existing_job_ids.setdefault((job["name"], job["script"]), job["id"])
+
+            page_token = result.get("next_page_token", "")
+            if not page_token:
+                break
+        return existing_job_ids
 
     def check_app_exist(self, subdomain: str, proj_id: str) -> bool:
         try:
@@ -1759,7 +1805,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
             encoded_option = urllib.parse.quote(
                 json.dumps(search_option).replace('"', '"')
             )
-            endpoint = Template(ApiV2Endpoints.SEARCH_APP.value).substitute(
+            endpoint = ApiV2Endpoints.SEARCH_APP.substitute(
                 project_id=proj_id, search_option=encoded_option
             )
             response = call_api_v2(
@@ -1780,7 +1826,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
             raise
 
     def get_models_listv2(self, proj_id: str):
-        endpoint = Template(ApiV2Endpoints.MODELS_LIST.value).substitute(
+        endpoint = ApiV2Endpoints.MODELS_LIST.substitute(
             project_id=proj_id
         )
         response = call_api_v2(
@@ -1793,7 +1839,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
         return response.json()
 
     def get_models_detailv2(self, proj_id: str, model_id: str):
-        endpoint = Template(ApiV2Endpoints.BUILD_MODEL.value).substitute(
+        endpoint = ApiV2Endpoints.BUILD_MODEL.substitute(
             project_id=proj_id, model_id=model_id
         )
         response = call_api_v2(
@@ -1805,8 +1851,9 @@ class ProjectImporter(BaseWorkspaceInteractor):
         )
         return response.json()
 
+    @cached_read("jobs")
     def get_jobs_listv2(self, proj_id: str):
-        endpoint = Template(ApiV2Endpoints.JOBS_LIST.value).substitute(
+        endpoint = ApiV2Endpoints.JOBS_LIST.substitute(
             project_id=proj_id
         )
         response = call_api_v2(
@@ -1818,8 +1865,9 @@ class ProjectImporter(BaseWorkspaceInteractor):
         )
         return response.json()
 
+    @cached_read("applications")
     def get_application_listv2(self, proj_id: str):
-        endpoint = Template(ApiV2Endpoints.APPS_LIST.value).substitute(
+        endpoint = ApiV2Endpoints.APPS_LIST.substitute(
             project_id=proj_id
         )
         response = call_api_v2(
@@ -1838,6 +1886,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
         return {"username": self.username}
 
     # Update project owner using V2 API
+    @invalidates_reads("project")
     def update_project_owner(self, project_id: str, new_owner_username: str):
         """
         Update the project owner using V2 API PATCH endpoint
@@ -1846,7 +1895,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
             project_id: The project ID
             new_owner_username: The username of the new owner
         """
-        endpoint = Template(ApiV2Endpoints.UPDATE_PROJECT.value).substitute(
+        endpoint = ApiV2Endpoints.UPDATE_PROJECT.substitute(
             project_id=project_id
         )
         json_data = {
@@ -2497,13 +2546,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
                                         })
                                 
                                 except HTTPError as e:
-                                    error_message = str(e)
-                                    if hasattr(e, 'response') and e.response is not None:
-                                        try:
-                                            error_json = e.response.json()
-                                            error_message = error_json.get("message") or error_json.get("error") or str(e)
-                                        except:
-                                            pass
+                                    error_message = get_error_message(e)
                                     
                                     logging.warning(f"⚠️  Failed to create build for model '{model_name}': {error_message}")
                                     logging.info(f"Model '{model_name}' created but without build - manual intervention required")
@@ -2523,13 +2566,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
                                 })
                         
                         except HTTPError as e:
-                            error_message = str(e)
-                            if hasattr(e, 'response') and e.response is not None:
-                                try:
-                                    error_json = e.response.json()
-                                    error_message = error_json.get("message") or error_json.get("error") or str(e)
-                                except:
-                                    pass
+                            error_message = get_error_message(e)
                             
                             logging.error(f"Failed to create model '{model_name}': {error_message}")
                             self.import_tracking["models_created_without_build"].append({
@@ -2707,13 +2744,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
                             except HTTPError as e:
                                 # Application creation failed
                                 logging.error(f"Failed to import application '{app_name}': {e}")
-                                error_message = str(e)
-                                if hasattr(e, 'response') and e.response is not None:
-                                    try:
-                                        error_json = e.response.json()
-                                        error_message = error_json.get("message") or error_json.get("error") or str(e)
-                                    except:
-                                        pass
+                                error_message = get_error_message(e)
                                 
                                 self.import_tracking["apps_removed_from_manifest"].append({
                                     "name": app_name,
@@ -2816,13 +2847,11 @@ class ProjectImporter(BaseWorkspaceInteractor):
             src_tgt_job_mapping = {}
             # Create job in target CML workspace.
             if job_metadata_list != None:
+                existing_job_ids = self.get_existing_job_ids(proj_id=project_id)
                 for job_metadata in job_metadata_list:
-                    job_name = job_metadata.get("name", "unknown")
-                    target_job_id = self.check_job_exist(
-                        job_name=job_metadata["name"],
-                        script=job_metadata["script"],
-                        proj_id=project_id,
-                    )
+                    job_key = _get_job_name_and_script(job_metadata)
+                    job_name = job_key[0]
+                    target_job_id = existing_job_ids.get(job_key)
                     if target_job_id == None:
                         job_metadata["project_id"] = project_id
                         job_metadata["paused"] = True
@@ -2867,11 +2896,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
                         ):
                             runtime_identifier = get_best_runtime(
                                 runtime_list["runtimes"],
-                                job_metadata["runtime_edition"],
-                                job_metadata["runtime_editor"],
-                                job_metadata["runtime_kernel"],
-                                job_metadata["runtime_shortversion"],
-                                job_metadata["runtime_fullversion"],
+                                *_get_runtime_match_fields(job_metadata),
                             )
                             if runtime_identifier != None:
                                 job_metadata["runtime_identifier"] = runtime_identifier
@@ -2896,6 +2921,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
                             target_job_id = self.create_job_v2(
                                 proj_id=project_id, job_metadata=job_metadata
                             )
+                            existing_job_ids.setdefault(job_key, target_job_id)
                             
                             if used_fallback:
                                 logging.info(f"✅ Job '{job_name}' created with fallback runtime")
@@ -2913,13 +2939,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
                                 })
                         
                         except HTTPError as e:
-                            error_message = str(e)
-                            if hasattr(e, 'response') and e.response is not None:
-                                try:
-                                    error_json = e.response.json()
-                                    error_message = error_json.get("message") or error_json.get("error") or str(e)
-                                except:
-                                    pass
+                            error_message = get_error_message(e)
                             
                             logging.error(f"Failed to create job '{job_name}': {error_message}")
                             self.import_tracking["jobs_skipped"].append({
@@ -2965,8 +2985,9 @@ class ProjectImporter(BaseWorkspaceInteractor):
             logging.info("Continuing despite job errors...")
             return
 
+    @cached_read("project")
     def get_project_infov2(self, proj_id: str):
-        endpoint = Template(ApiV2Endpoints.GET_PROJECT.value).substitute(
+        endpoint = ApiV2Endpoints.GET_PROJECT.substitute(
             project_id=proj_id
         )
         response = call_api_v2(
@@ -2987,13 +3008,13 @@ class ProjectImporter(BaseWorkspaceInteractor):
             logging.info("Project {} has {} Jobs".format(self.project_name, len(job_list)))
         job_metadata_list = []
         for job in job_list:
-            job_info_flatten = flatten_json_data(job)
-            job_metadata = extract_fields(job_info_flatten, constants.JOB_MAP)
+            job_metadata = _extract_job_fields(job)
             job_name_list.append(job_metadata["name"])
             job_metadata_list.append(job_metadata)
         self.metrics_data["total_job"] = len(job_name_list)
-        self.metrics_data["job_name_list"] = sorted(job_name_list)
-        return job_metadata_list, sorted(job_name_list)
+        sorted_job_name_list = sorted(job_name_list)
+        self.metrics_data["job_name_list"] = sorted_job_name_list
+        return job_metadata_list, sorted_job_name_list
 
     def collect_import_model_list(self, project_id):
         model_list = self.get_models_listv2(proj_id=project_id)["models"]
@@ -3022,8 +3043,9 @@ class ProjectImporter(BaseWorkspaceInteractor):
             model_name_list.append(model_info_flatten["name"])
             model_metadata_list.append(model_detail_data)
         self.metrics_data["total_model"] = len(model_name_list)
-        self.metrics_data["model_name_list"] = sorted(model_name_list)
-        return model_metadata_list, sorted(model_name_list)
+        sorted_model_name_list = sorted(model_name_list)
+        self.metrics_data["model_name_list"] = sorted_model_name_list
+        return model_metadata_list, sorted_model_name_list
 
     def collect_import_application_list(self, project_id):
         app_list = self.get_application_listv2(proj_id=project_id)["applications"]
@@ -3036,10 +3058,10 @@ class ProjectImporter(BaseWorkspaceInteractor):
             logging.info("Project {} has {} Application".format(self.project_name, len(app_list)))
         app_metadata_list = []
         for app in app_list:
-            app_info_flatten = flatten_json_data(app)
-            app_metadata = extract_fields(app_info_flatten, constants.APPLICATION_MAPV2)
+            app_metadata = _extract_application_fields(app)
             app_name_list.append(app_metadata["name"])
             app_metadata_list.append(app_metadata)
         self.metrics_data["total_application"] = len(app_name_list)
-        self.metrics_data["application_name_list"] = sorted(app_name_list)
-        return app_metadata_list, sorted(app_name_list)
+        sorted_app_name_list = sorted(app_name_list)
+        self.metrics_data["application_name_list"] = sorted_app_name_list
+        return app_metadata_list, sorted_app_name_list
@@ -2,15 +2,222 @@ import json
 import logging
 import os
 import csv
+import functools
+import gzip
+import random
 import shutil
+import threading
+import time
 import urllib
-from encodings import utf_8
-from string import Template
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
 
 import requests
-from flatten_json import flatten
+import urllib3
 from requests.adapters import HTTPAdapter, Retry
 
+try:
+    import orjson
+except ImportError:  # optional speed-up, fall back to the stdlib json module
+    orjson = None
+
+# Request bodies at least this large are gzip-compressed when
+# CMLUTILS_GZIP_REQUESTS=true (the target server must accept Content-Encoding: gzip).
+GZIP_MIN_REQUEST_BYTES = 8 * 1024
+
+
+def _dumps_body(json_data) -> bytes:
+    # Serialize request bodies ourselves so orjson is used when available
+    if orjson is not None:
+        return orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(json_data).encode("utf-8")
+
+
+def _gzip_body(body: bytes):
+    if os.environ.get("CMLUTILS_GZIP_REQUESTS", "False").lower() != "true":
+        return None
+    if len(body) < GZIP_MIN_REQUEST_BYTES:
+        return None
+    return gzip.compress(body)
+
+
+# Sessions shared by all API calls so connections (and TLS handshakes) are
+# reused; built on first use by _get_session_v1/_get_session_v2. urllib3
+# already keeps a separate connection pool per host inside each session, and
+# credentials are passed per request, so one session per API style suffices.
+_SESSION_LOCK = threading.Lock()
+_V1_SESSION = None
+_V2_SESSION = None
+
+# Retry backoff is capped at RETRY_BACKOFF_MAX seconds and randomized by up to
+# RETRY_BACKOFF_JITTER seconds so concurrent workers don't retry in lockstep.
+RETRY_BACKOFF_MAX = 30
+RETRY_BACKOFF_JITTER = 0.5
+
+
+class _JitteredRetry(Retry):
+    # urllib3 < 2.0 has no backoff_jitter/backoff_max arguments
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return min(RETRY_BACKOFF_MAX, backoff + random.random() * RETRY_BACKOFF_JITTER)
+
+
+# Retry objects are immutable (urllib3 copies them per request), so one
+# policy is shared by every adapter.
+try:
+    _RETRIES = Retry(
+        total=4,
+        backoff_factor=0.1,
+        backoff_max=RETRY_BACKOFF_MAX,
+        backoff_jitter=RETRY_BACKOFF_JITTER,
+        status_forcelist=[500, 502, 503, 504],
+    )
+except TypeError:
+    _RETRIES = _JitteredRetry(
+        total=4,
+        backoff_factor=0.1,
+        status_forcelist=[500, 502, 503, 504],
+    )
+
+
+# One adapter (and so one set of connection pools) behind both sessions: v1
+# and v2 calls to the same workspace reuse each other's keep-alive sockets.
+# pool_block=False opens an extra connection instead of waiting when a
+# pool is exhausted.
+_ADAPTER = HTTPAdapter(
+    max_retries=_RETRIES, pool_connections=16, pool_maxsize=64, pool_block=False
+)
+
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    session.mount("http://", _ADAPTER)
+    session.mount("https://", _ADAPTER)
+    session.headers.update(
+        {"Content-Type": "application/json", "Connection": "keep-alive"}
+    )
+    # Don't carry cookies from one call (and API key) over to the next
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def _dumps_indented(json_data) -> str:
+    if orjson is not None:
+        return orjson.dumps(
+            json_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(json_data, indent=2)
+
+
+class _LazyLogArg:
+    """
+    Defer an expensive log argument until a handler actually formats it.
+    Each handler formats the record separately, so the result is cached.
+    """
+
+    __slots__ = ("func", "arg", "text")
+
+    def __init__(self, func, arg):
+        self.func = func
+        self.arg = arg
+        self.text = None
+
+    def __str__(self):
+        if self.text is None:
+            self.text = self.func(self.arg)
+        return self.text
+
+
+def _is_verbose() -> bool:
+    # CMLUTILS_VERBOSE is set when a command configures logging (after import),
+    # so it is read per call, but only once the cheap level check passes.
+    return (
+        logging.getLogger().isEnabledFor(logging.DEBUG)
+        and os.environ.get("CMLUTILS_VERBOSE", "False").lower() == "true"
+    )
+
+
+# Verbose mode logs at most this many bytes of each response body
+RESPONSE_LOG_PREVIEW_BYTES = 2048
+
+
+def _response_preview(resp: requests.Response) -> str:
+    # Slice the raw body instead of parsing and re-serializing JSON just to
+    # truncate it for the log.
+    body = resp.content
+    preview = body[:RESPONSE_LOG_PREVIEW_BYTES].decode("utf-8", "replace")
+    if len(body) > RESPONSE_LOG_PREVIEW_BYTES:
+        preview += "... (truncated)"
+    return preview
+
+
+@functools.lru_cache(maxsize=8)
+def _host_origin(host: str):
+    # Only a bare "scheme://netloc[/]" host can be joined by concatenation;
+    # anything with a path, query or fragment keeps urljoin's resolution rules.
+    parts = urllib.parse.urlsplit(host)
+    if parts.scheme and parts.netloc and parts.path in ("", "/") and not (
+        parts.query or parts.fragment
+    ):
+        return host.rstrip("/")
+    return None
+
+
+def _join_url(host: str, endpoint: str) -> str:
+    origin = _host_origin(host)
+    if origin is None or "://" in endpoint:
+        return urllib.parse.urljoin(host, endpoint)
+    return origin + "/" + endpoint.lstrip("/")
+
+
+@functools.lru_cache(maxsize=8)
+def _v2_headers(user_token: str) -> dict:
+    return {"Authorization": "Bearer {}".format(user_token)}
+
+
+@functools.lru_cache(maxsize=None)
+def _warn_insecure_once():
+    # Warn a single time instead of letting urllib3 emit an
+    # InsecureRequestWarning on every unverified request.
+    logging.warning(
+        "SSL certificate verification is disabled (ca_path=False); "
+        "HTTPS requests to the CML workspace are unverified."
+    )
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_verify(ca_path: str):
+    # ca_path "False" disables verification, "" uses the system CA store
+    if ca_path.lower() == "false":
+        _warn_insecure_once()
+        return False
+    return ca_path if ca_path != "" else True
+
+
+def is_ssl_verification_disabled(ca_path: str) -> bool:
+    return _resolve_verify(ca_path) is False
+
+
+def _get_session_v1() -> requests.Session:
+    global _V1_SESSION
+    if _V1_SESSION is None:
+        with _SESSION_LOCK:
+            if _V1_SESSION is None:
+                _V1_SESSION = _new_session()
+    return _V1_SESSION
+
+
+def _get_session_v2() -> requests.Session:
+    global _V2_SESSION
+    if _V2_SESSION is None:
+        with _SESSION_LOCK:
+            if _V2_SESSION is None:
+                _V2_SESSION = _new_session()
+    return _V2_SESSION
+
 
 def call_api_v1(
     host: str,
@@ -20,70 +227,54 @@ def call_api_v1(
     json_data: dict = None,
     ca_path: str = "",
 ) -> requests.Response:
-    import time
-    
-    url = urllib.parse.urljoin(host, endpoint)
+    url = _join_url(host, endpoint)
     
     # Check if verbose mode is enabled
-    verbose = os.environ.get('CMLUTILS_VERBOSE', 'False').lower() == 'true'
+    verbose = _is_verbose()
     
     if verbose:
         logging.debug("API v1 Request: %s %s", method.upper(), url)
         if json_data:
-            logging.debug("API v1 Request Body: %s", json.dumps(json_data, indent=2))
+            logging.debug(
+                "API v1 Request Body: %s", _LazyLogArg(_dumps_indented, json_data)
+            )
     
-    s = requests.Session()
-    retries = Retry(
-        total=3,
-        backoff_factor=0.1,
-        status_forcelist=[500, 502, 503, 504],
-    )
-    s.mount("http://", HTTPAdapter(max_retries=retries))
-    s.mount("https://", HTTPAdapter(max_retries=retries))
-    headers = {"Content-Type": "application/json"}
+    s = _get_session_v1()
+    verify = _resolve_verify(ca_path)
     resp = None
     
-    start_time = time.time()
+    start_time = time.perf_counter() if verbose else None
     try:
         if json_data != None:
             resp = s.request(
                 method=method.upper(),
                 url=url,
                 auth=(api_key, ""),
-                headers=headers,
-                json=json_data,
-                verify=False if ca_path.lower() == "false" else (ca_path if ca_path != "" else True),
+                data=_dumps_body(json_data),
+                verify=verify,
             )
         else:
             resp = s.request(
                 method=method.upper(),
                 url=url,
                 auth=(api_key, ""),
-                headers=headers,
-                verify=False if ca_path.lower() == "false" else (ca_path if ca_path != "" else True),
+                verify=verify,
             )
         
-        elapsed_time = time.time() - start_time
-        
         if verbose:
+            elapsed_time = time.perf_counter() - start_time
             logging.debug("API v1 Response: %s (Status: %d, Time: %.2fs)", 
                          url, resp.status_code, elapsed_time)
             if resp.headers.get("content-type", "").startswith("application/json"):
-                try:
-                    response_data = resp.json()
-                    # Log only first few lines of response to avoid overwhelming logs
-                    response_str = json.dumps(response_data, indent=2)
-                    if len(response_str) > 1000:
-                        response_str = response_str[:1000] + "... (truncated)"
-                    logging.debug("API v1 Response Body: %s", response_str)
-                except:
-                    logging.debug("API v1 Response Body: (non-JSON or too large)")
+                logging.debug(
+                    "API v1 Response Body: %s", _LazyLogArg(_response_preview, resp)
+                )
         
         resp.raise_for_status()  # Raise an exception for 4xx or 5xx errors
         return resp
     except requests.exceptions.RequestException as e:
-        elapsed_time = time.time() - start_time
         if verbose:
+            elapsed_time = time.perf_counter() - start_time
             logging.debug("API v1 Request Failed: %s (Time: %.2fs, Error: %s)", 
                          url, elapsed_time, str(e))
         if resp != None and "application/json" in resp.headers.get("content-type", ""):
@@ -99,198 +290,319 @@ def call_api_v2(
     json_data: dict = None,
     ca_path: str = "",
 ) -> requests.Response:
-    import time
-    
-    url = urllib.parse.urljoin(host, endpoint)
+    url = _join_url(host, endpoint)
     
     # Check if verbose mode is enabled
-    verbose = os.environ.get('CMLUTILS_VERBOSE', 'False').lower() == 'true'
+    verbose = _is_verbose()
     
     if verbose:
         logging.debug("API v2 Request: %s %s", method.upper(), url)
         if json_data:
-            logging.debug("API v2 Request Body: %s", json.dumps(json_data, indent=2))
+            logging.debug(
+                "API v2 Request Body: %s", _LazyLogArg(_dumps_indented, json_data)
+            )
     
-    s = requests.Session()
-    retries = Retry(
-        total=3,
-        backoff_factor=0.1,
-        status_forcelist=[500, 502, 503, 504],
-    )
-    s.mount("http://", HTTPAdapter(max_retries=retries))
-    s.mount("https://", HTTPAdapter(max_retries=retries))
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": "Bearer {}".format(user_token),
-    }
+    s = _get_session_v2()
+    verify = _resolve_verify(ca_path)
+    headers = _v2_headers(user_token)
     resp = None
+    body = _dumps_body(json_data) if json_data != None else None
+    gzipped_body = _gzip_body(body) if body != None else None
     
-    start_time = time.time()
+    start_time = time.perf_counter() if verbose else None
     try:
-        if json_data != None:
+        if gzipped_body != None:
+            resp = s.request(
+                method=method.upper(),
+                url=url,
+                headers={**headers, "Content-Encoding": "gzip"},
+                data=gzipped_body,
+                verify=verify,
+            )
+        elif body != None:
             resp = s.request(
                 method=method.upper(),
                 url=url,
                 headers=headers,
-                json=json_data,
-                verify=False if ca_path.lower() == "false" else (ca_path if ca_path != "" else True),
+                data=body,
+                verify=verify,
             )
         else:
             resp = s.request(
                 method=method.upper(),
                 url=url,
                 headers=headers,
-                verify=False if ca_path.lower() == "false" else (ca_path if ca_path != "" else True),
+                verify=verify,
             )
         
-        elapsed_time = time.time() - start_time
-        
         if verbose:
+            elapsed_time = time.perf_counter() - start_time
             logging.debug("API v2 Response: %s (Status: %d, Time: %.2fs)", 
                          url, resp.status_code, elapsed_time)
             if resp.headers.get("content-type", "").startswith("application/json"):
-                try:
-                    response_data = resp.json()
-                    # Log only first few lines of response to avoid overwhelming logs
-                    response_str = json.dumps(response_data, indent=2)
-                    if len(response_str) > 1000:
-                        response_str = response_str[:1000] + "... (truncated)"
-                    logging.debug("API v2 Response Body: %s", response_str)
-                except:
-                    logging.debug("API v2 Response Body: (non-JSON or too large)")
+                logging.debug(
+                    "API v2 Response Body: %s", _LazyLogArg(_response_preview, resp)
+                )
         
         resp.raise_for_status()  # Raise an exception for 4xx or 5xx errors
         return resp
     except requests.exceptions.RequestException as e:
-        elapsed_time = time.time() - start_time
         if verbose:
+            elapsed_time = time.perf_counter() - start_time
             logging.debug("API v2 Request Failed: %s (Time: %.2fs, Error: %s)", 
                          url, elapsed_time, str(e))
-        logging.warning(f"Error: {e}")
         if resp != None and "application/json" in resp.headers.get("content-type", ""):
             logging.error("Error response from API: %s", resp.json())
         raise
 
 
+# Upper bound on concurrent requests issued by the call_api_*_many helpers;
+# kept below the adapter's pool_maxsize so connections are not discarded.
+API_MAX_WORKERS = 16
+
+# Shared by the *_many helpers; worker threads are only started on first use.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=API_MAX_WORKERS, thread_name_prefix="cmlutils-api"
+)
+
+
+def _map_concurrently(func, items) -> list:
+    # Results come back in input order; the first failure is re-raised
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    return list(_EXECUTOR.map(func, items))
+
+
+def call_api_v1_many(host: str, api_key: str, ca_path: str, requests_list) -> list:
+    """
+    Run independent call_api_v1 requests concurrently over the shared session.
+    requests_list holds (endpoint, method) or (endpoint, method, json_data)
+    tuples; responses are returned in the same order. The first failing
+    request's exception is raised, as with a sequential loop.
+    """
+
+    def _call(request):
+        endpoint, method, *json_data = request
+        return call_api_v1(host, endpoint, method, api_key, *json_data, ca_path=ca_path)
+
+    return _map_concurrently(_call, requests_list)
+
+
+def call_api_v2_many(
+    host: str, endpoints, method: str, user_token: str, ca_path: str = ""
+) -> list:
+    """
+    call_api_v2 the same method on each endpoint concurrently, e.g. a batch of
+    independent GETs. Responses are returned in endpoint order.
+    """
+    return _map_concurrently(
+        lambda endpoint: call_api_v2(host, endpoint, method, user_token, ca_path=ca_path),
+        endpoints,
+    )
+
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
 def download_file(url: str, filepath: str, ca_path: str = ""):
-    with requests.get(url, stream=True, verify=False if ca_path.lower() == "false" else (ca_path if ca_path != "" else True)) as r:
-        with open(filepath, "wb") as f:
-            shutil.copyfileobj(r.raw, f)
+    with _get_session_v1().get(
+        url, stream=True, verify=_resolve_verify(ca_path)
+    ) as r:
+        # Fail before creating the file rather than saving an error page
+        r.raise_for_status()
+        # Undo any Content-Encoding while streaming instead of writing it to disk
+        r.raw.decode_content = True
+        with open(filepath, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+            shutil.copyfileobj(r.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+
+
+def get_error_message(error: requests.exceptions.RequestException) -> str:
+    """Return the message/error field of a JSON error response, else str(error)."""
+    response = getattr(error, "response", None)
+    content = (response.content or b"") if response is not None else b""
+    # Only a JSON object can carry a message, skip parsing anything else
+    if content.lstrip()[:1] == b"{":
+        try:
+            error_json = orjson.loads(content) if orjson is not None else json.loads(content)
+            return error_json.get("message") or error_json.get("error") or str(error)
+        except ValueError:
+            pass
+    return str(error)
 
 
 def extract_fields(json_data, field_map):
-    output = {}
+    # Walk field_map (not a key-set intersection) so output keeps its order
+    return {
+        new_field: json_data[old_field]
+        for old_field, new_field in field_map.items()
+        if old_field in json_data
+    }
+
+
+def make_field_extractor(field_map):
+    """
+    Build a function equivalent to extract_fields(flatten_json_data(x), field_map)
+    that reads only the dotted paths listed in field_map instead of flattening
+    the whole JSON object first.
+    """
+    lines = ["def _extract_fields(json_data):", "    output = {}"]
     for old_field, new_field in field_map.items():
-        try:
-            value = json_data[old_field]
-        except KeyError:
-            continue
-        output[new_field] = value
-    return output
+        accessor = "json_data" + "".join(
+            "[{!r}]".format(part) for part in old_field.split(".")
+        )
+        lines.extend(
+            [
+                "    try:",
+                "        value = {}".format(accessor),
+                "    except (KeyError, TypeError):",
+                "        pass",
+                "    else:",
+                # flatten only keeps empty containers and scalars as leaves
+                "        if not value or not isinstance(value, (dict, list, set, tuple)):",
+                "            output[{!r}] = value".format(new_field),
+            ]
+        )
+    lines.append("    return output")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_extract_fields"]
 
 
 def read_json_file(file_path):
-    with open(file_path, "r", encoding=utf_8.getregentry().name) as f:
+    if orjson is not None:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(file_path, "r", encoding="utf-8") as f:
         json_data = json.load(f)
     return json_data
 
 
 def write_json_file(file_path, json_data):
-    with open(file_path, "w", encoding=utf_8.getregentry().name) as f:
-        json.dump(json_data, f)
+    if orjson is not None:
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(json_data, f)
     # Set file permissions to 600 (read and write only for the owner)
     os.chmod(file_path, 0o600)
 
 
-def flatten_json_data(json_data):
-    return flatten(json_data, ".")
+def flatten_json_data(json_data, separator="."):
+    """
+    Flatten nested dicts/lists into a single dict keyed by dotted paths.
+    Keys, values and ordering match the flatten_json package this replaced:
+    empty containers and scalars are kept as leaves, list items are keyed by index.
+    """
+    flattened = {}
+    top = json_data.items() if isinstance(json_data, dict) else enumerate(json_data)
+    stack = list(reversed(list(top)))
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        key, value = pop()
+        if not value or not isinstance(value, (dict, list, set, tuple)):
+            flattened[key] = value
+            continue
+        children = value.items() if isinstance(value, dict) else enumerate(value)
+        # Push in reverse so keys come out in the same depth-first order
+        extend(
+            reversed(
+                [
+                    (
+                        "{}{}{}".format(key, separator, child_key) if key else child_key,
+                        child,
+                    )
+                    for child_key, child in children
+                ]
+            )
+        )
+    return flattened
+
+
+def _canonicalize_runtime(runtime):
+    # Project a V1 (camelCase) or V2 (snake_case) runtime onto snake_case keys
+    return {
+        "id": runtime.get("id"),
+        "kernel": runtime.get("kernel"),
+        "edition": runtime.get("edition"),
+        "editor": runtime.get("editor"),
+        "short_version": runtime.get("shortVersion", runtime.get("short_version")),
+        "full_version": runtime.get("fullVersion", runtime.get("full_version")),
+        "image_identifier": runtime.get(
+            "imageIdentifier", runtime.get("image_identifier")
+        ),
+    }
+
+
+def canonicalize_runtimes(runtime_list):
+    """
+    Normalize a runtime list once, when it is fetched, so the matching helpers
+    below can read snake_case keys directly instead of trying both spellings.
+    """
+    return list(map(_canonicalize_runtime, runtime_list))
 
 
 def get_best_runtime(json_list, edition, editor, kernel, short_version, full_version):
     """
     Find the best matching runtime from a list.
-    Supports both V1 API (camelCase) and V2 API (snake_case) field names.
-    Progressively loosens matching criteria if exact match not found.
+    Expects V2 API (snake_case) field names; pass V1 lists through
+    canonicalize_runtimes first.
+    Scores every runtime in a single pass, from the best match to the loosest:
+      5: kernel, edition, editor, short_version and full_version
+      4: kernel, edition, editor and short_version (any full_version)
+      3: kernel, edition and editor ("Standard" also accepts "Rsync" editions)
+      2: kernel and editor
+      1: kernel only
+    The first runtime with the highest score wins.
     """
-    
-    # Helper function to get field value supporting both V1 and V2 API naming
-    def get_field(obj, v1_name, v2_name):
-        """Get field value, checking both V1 (camelCase) and V2 (snake_case) names"""
-        return obj.get(v1_name, obj.get(v2_name))
-    
-    def get_image_id(obj):
-        """Get image identifier, supporting both naming conventions"""
-        return get_field(obj, "imageIdentifier", "image_identifier")
-    
-    # Best match: all five criteria (kernel, edition, editor, short_version, full_version)
-    for json_obj in json_list:
-        obj_kernel = json_obj.get("kernel")
-        obj_edition = json_obj.get("edition")
-        obj_editor = json_obj.get("editor")
-        obj_short_version = get_field(json_obj, "shortVersion", "short_version")
-        obj_full_version = get_field(json_obj, "fullVersion", "full_version")
-        
-        if all([obj_kernel, obj_edition, obj_editor, obj_short_version, obj_full_version]):
-            if (obj_kernel == kernel and obj_edition == edition and obj_editor == editor 
-                and obj_short_version == short_version and obj_full_version == full_version):
-                img_id = get_image_id(json_obj)
-                if img_id:
-                    return img_id
-
-    # Good match: four criteria (kernel, edition, editor, short_version) - ignore full_version
+    best_score = 0
+    best_image_id = None
+    # Rsync is essentially Standard + rsync capability
+    accepted_editions = ("Standard", "Rsync") if edition == "Standard" else (edition,)
     for json_obj in json_list:
         obj_kernel = json_obj.get("kernel")
-        obj_edition = json_obj.get("edition")
-        obj_editor = json_obj.get("editor")
-        obj_short_version = get_field(json_obj, "shortVersion", "short_version")
-        
-        if all([obj_kernel, obj_edition, obj_editor, obj_short_version]):
-            if (obj_kernel == kernel and obj_edition == edition and obj_editor == editor 
-                and obj_short_version == short_version):
-                img_id = get_image_id(json_obj)
-                if img_id:
-                    return img_id
-
-    # Acceptable match: three criteria (kernel, edition, editor) - ignore versions
-    # This is the key fallback for different build versions!
-    for json_obj in json_list:
-        obj_kernel = json_obj.get("kernel")
-        obj_edition = json_obj.get("edition")
-        obj_editor = json_obj.get("editor")
-        
-        if all([obj_kernel, obj_edition, obj_editor]):
-            # Normalize edition matching - "Standard" should match "Standard" or "Rsync"
-            # Rsync is essentially Standard + rsync capability
-            edition_match = (
-                obj_edition == edition or
-                (edition == "Standard" and obj_edition in ["Standard", "Rsync"])
-            )
-            
-            if obj_kernel == kernel and edition_match and obj_editor == editor:
-                img_id = get_image_id(json_obj)
-                if img_id:
-                    return img_id
+        if not obj_kernel or obj_kernel != kernel:
+            continue
+        image_id = json_obj.get("image_identifier")
+        if not image_id:
+            continue
 
-    # Minimal match: kernel and editor only
-    for json_obj in json_list:
-        obj_kernel = json_obj.get("kernel")
+        score = 1
         obj_editor = json_obj.get("editor")
-        
-        if obj_kernel and obj_editor:
-            if obj_kernel == kernel and obj_editor == editor:
-                img_id = get_image_id(json_obj)
-                if img_id:
-                    return img_id
-
-    # Last resort: kernel only
-    for json_obj in json_list:
-        obj_kernel = json_obj.get("kernel")
-        if obj_kernel and obj_kernel == kernel:
-            img_id = get_image_id(json_obj)
-            if img_id:
-                return img_id
-
-    return None
+        if obj_editor and obj_editor == editor:
+            score = 2
+            obj_edition = json_obj.get("edition")
+            if obj_edition and obj_edition in accepted_editions:
+                score = 3
+                obj_short_version = json_obj.get("short_version")
+                if (
+                    obj_edition == edition
+                    and obj_short_version
+                    and obj_short_version == short_version
+                ):
+                    score = 4
+                    obj_full_version = json_obj.get("full_version")
+                    if obj_full_version and obj_full_version == full_version:
+                        return image_id
+
+        if score > best_score:
+            best_score = score
+            best_image_id = image_id
+
+    return best_image_id
+
+
+def _runtime_properties(runtime):
+    # runtime uses the snake_case keys produced by _canonicalize_runtime
+    return {
+        "runtime_kernel": runtime["kernel"],
+        "runtime_edition": runtime["edition"],
+        "runtime_editor": runtime["editor"],
+        "runtime_fullversion": runtime["full_version"],
+        "runtime_shortversion": runtime["short_version"],
+    }
 
 
 def find_runtime(runtime_list, runtime_id: int):
@@ -300,20 +612,33 @@ def find_runtime(runtime_list, runtime_id: int):
     """
     for runtime in runtime_list:
         if "id" in runtime and runtime["id"] == runtime_id:
-            # Support both V1 (camelCase) and V2 (snake_case) field names
-            full_version = runtime.get("fullVersion", runtime.get("full_version"))
-            short_version = runtime.get("shortVersion", runtime.get("short_version"))
-            
-            return {
-                "runtime_kernel": runtime["kernel"],
-                "runtime_edition": runtime["edition"],
-                "runtime_editor": runtime["editor"],
-                "runtime_fullversion": full_version,
-                "runtime_shortversion": short_version,
-            }
+            return _runtime_properties(_canonicalize_runtime(runtime))
     return None
 
 
+def build_runtime_index(runtime_list, key: str = "id"):
+    """
+    Index canonical runtimes by the given field so repeated lookups are O(1).
+    The first runtime wins on duplicate keys, like a linear scan would.
+    """
+    runtime_index = {}
+    for runtime in runtime_list:
+        value = runtime.get(key)
+        if value is not None:
+            runtime_index.setdefault(value, runtime)
+    return runtime_index
+
+
+def find_runtime_indexed(runtime_index, runtime_id: int):
+    """
+    Same as find_runtime, but over an index built by build_runtime_index.
+    """
+    runtime = runtime_index.get(runtime_id)
+    if runtime is None:
+        return None
+    return _runtime_properties(runtime)
+
+
 def get_absolute_path(path: str) -> str:
     # Special case: if path is "False" (for disabling SSL verification), return it as-is
     if path.lower() == "false":
@@ -330,60 +655,37 @@ def parse_runtimes_v2(runtimes):
     return legacy_runtime_image_map
 
 
-def _get_runtimes_v2(runtimes, editor="Workbench", edition="Standard"):
-    legacy_runtime_image_map = {}
-    legacy_runtime_kernel_map = {}
+_LEGACY_KERNEL_MARKERS = (("python3", "Python"), ("r", "R"), ("scala", "Scala"))
+
 
+def _get_runtimes_v2(runtimes, editor="Workbench", edition="Standard"):
     logging.info(
         "Populating Engine to Runtimes Mapping for editor: %s, edition: %s",
         editor,
         edition,
     )
 
+    # Track the highest kernel per language in one pass; a kernel name can
+    # match more than one language, so each marker is checked independently
+    best_runtimes = {}
     for image_details in runtimes:
-        if image_details["editor"] == editor and image_details["edition"] == edition:
-            if "Python" in image_details["kernel"]:
-                if "python3" not in legacy_runtime_image_map:
-                    legacy_runtime_kernel_map["python3"] = image_details["kernel"]
-                    legacy_runtime_image_map["python3"] = image_details[
-                        "image_identifier"
-                    ]
-                    legacy_runtime_image_map["python2"] = image_details[
-                        "image_identifier"
-                    ]
-                else:
-                    if image_details["kernel"] > legacy_runtime_kernel_map["python3"]:
-                        legacy_runtime_kernel_map["python3"] = image_details["kernel"]
-                        legacy_runtime_image_map["python3"] = image_details[
-                            "image_identifier"
-                        ]
-                        legacy_runtime_image_map["python2"] = image_details[
-                            "image_identifier"
-                        ]
-
-            if "R" in image_details["kernel"]:
-                if "r" not in legacy_runtime_image_map:
-                    legacy_runtime_kernel_map["r"] = image_details["kernel"]
-                    legacy_runtime_image_map["r"] = image_details["image_identifier"]
-                else:
-                    if image_details["kernel"] > legacy_runtime_kernel_map["r"]:
-                        legacy_runtime_kernel_map["r"] = image_details["kernel"]
-                        legacy_runtime_image_map["r"] = image_details[
-                            "image_identifier"
-                        ]
-
-            if "Scala" in image_details["kernel"]:
-                if "scala" not in legacy_runtime_image_map:
-                    legacy_runtime_kernel_map["scala"] = image_details["kernel"]
-                    legacy_runtime_image_map["scala"] = image_details[
-                        "image_identifier"
-                    ]
-                else:
-                    if image_details["kernel"] > legacy_runtime_kernel_map["scala"]:
-                        legacy_runtime_kernel_map["scala"] = image_details["kernel"]
-                        legacy_runtime_image_map["scala"] = image_details[
-                            "image_identifier"
-                        ]
+        if image_details["editor"] != editor or image_details["edition"] != edition:
+            continue
+        kernel = image_details["kernel"]
+        for language, marker in _LEGACY_KERNEL_MARKERS:
+            if marker in kernel:
+                best = best_runtimes.get(language)
+                if best is None or kernel > best["kernel"]:
+                    best_runtimes[language] = image_details
+
+    legacy_runtime_image_map = {}
+    for language, _ in _LEGACY_KERNEL_MARKERS:
+        if language in best_runtimes:
+            legacy_runtime_image_map[language] = best_runtimes[language][
+                "image_identifier"
+            ]
+    if "python3" in legacy_runtime_image_map:
+        legacy_runtime_image_map["python2"] = legacy_runtime_image_map["python3"]
 
     # Assigning Default runtime to Python3
     legacy_runtime_image_map["default"] = legacy_runtime_image_map["python3"]
@@ -394,10 +696,9 @@ def _get_runtimes_v2(runtimes, editor="Workbench", edition="Standard"):
 def compare_metadata(
     import_data, export_data, import_data_list, export_data_list, skip_field=None
 ):
-    if skip_field is None:
-        skip_field = []
+    skip = frozenset(skip_field) if skip_field else frozenset()
 
-    data_list_diff = list(set(sorted(export_data_list)) - set(sorted(import_data_list)))
+    data_list_diff = list(set(export_data_list).difference(import_data_list))
     config_differences = {}
 
     import_data_dict = {data["name"]: data for data in import_data}
@@ -410,20 +711,24 @@ def compare_metadata(
             continue
 
         for key, value in im_data.items():
-            if key not in skip_field:
-                ex_value = ex_data.get(key)
-                if ex_value is not None and str(ex_value) != str(value):
-                    difference = ["{} value in destination is {}, and source is {}".format(
-                        key, str(value), str(ex_value))]
-                    if config_differences.get(name):
-                        config_differences[name].extend(difference)
-                    else:
-                        config_differences[name]= difference
+            if key in skip:
+                continue
+            ex_value = ex_data.get(key)
+            if ex_value is None:
+                continue
+            str_value = str(value)
+            str_ex_value = str(ex_value)
+            if str_ex_value != str_value:
+                config_differences.setdefault(name, []).append(
+                    "{} value in destination is {}, and source is {}".format(
+                        key, str_value, str_ex_value
+                    )
+                )
     return data_list_diff, config_differences
 
 
 def update_verification_status(data_diff, message):
     if data_diff:
-        logging.info("\033[31mERROR: {} Not Successful\033[0m".format(message))
+        logging.info("\033[31mERROR: %s Not Successful\033[0m", message)
     else:
-        logging.info("\033[32mSUCCESS: {} Successful \033[0m".format(message))
+        logging.info("\033[32mSUCCESS: %s Successful \033[0m", message)
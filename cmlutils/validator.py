@@ -290,7 +290,7 @@ class ProjectBelongsToUserValidator(ExportValidators):
             # Search for project using V2 API
             search_option = {"name": self.project_name}
             encoded_option = urllib.parse.quote(json.dumps(search_option).replace('"', '"'))
-            endpoint = Template(ApiV2Endpoints.SEARCH_PROJECT.value).substitute(
+            endpoint = ApiV2Endpoints.SEARCH_PROJECT.substitute(
                 search_option=encoded_option
             )
             response = call_api_v2(
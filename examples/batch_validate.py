@@ -43,7 +43,7 @@ def migration_validate(project_name: str):
     import_metrics_file_path = os.path.join(get_absolute_path(output_dir[OUTPUT_DIR_KEY]), project_name, IMPORT_METRIC_FILE)
 
     try:
-        with open(import_metrics_file_path, "r") as file:
+        with open(import_metrics_file_path, "r", encoding="utf-8") as file:
             data = json.load(file)
     except FileNotFoundError:
         is_migration_successful = False
@@ -33,22 +33,32 @@ fi
 
 echo "Starting installation..."
 
-# Create virtual environment
-echo "Creating virtual environment..."
-python3 -m venv cmlutils-env
+# Fingerprint the dependency files so a re-run can reuse an existing environment
+fingerprint=$(cat setup.py requirements.txt pyproject.toml 2>/dev/null | python3 -c "import hashlib, sys; print(hashlib.blake2b(sys.stdin.buffer.read()).hexdigest())")
+fingerprint_file="cmlutils-env/.cmlutils_fingerprint"
 
-# Activate virtual environment and install
-echo "Installing cmlutils..."
-source cmlutils-env/bin/activate
-pip install --upgrade pip
-pip install -e .
+if [ -f "$fingerprint_file" ] && [ "$(cat "$fingerprint_file")" = "$fingerprint" ] \
+    && cmlutils-env/bin/python -I -c "import cmlutils.cli_entrypoint" &> /dev/null; then
+    echo "Virtual environment is up to date, skipping dependency installation..."
+else
+    # Create virtual environment
+    echo "Creating virtual environment..."
+    python3 -m venv cmlutils-env
+
+    # Activate virtual environment and install
+    echo "Installing cmlutils..."
+    source cmlutils-env/bin/activate
+    pip install --upgrade pip
+    pip install -e .
+    echo "$fingerprint" > "$fingerprint_file"
+fi
 
 # Create wrapper script
 echo "Creating cmlutil wrapper script..."
 cat > cmlutil << 'EOF'
 #!/bin/bash
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-"$SCRIPT_DIR/cmlutils-env/bin/python" -m cmlutils.cli_entrypoint "$@"
+"$SCRIPT_DIR/cmlutils-env/bin/python" -c 'from cmlutils.cli_entrypoint import cli; cli(prog_name="cmlutil")' "$@"
 EOF
 chmod +x cmlutil
 
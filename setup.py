@@ -1,14 +1,13 @@
-from encodings import utf_8
 from typing import List
 
 import setuptools
 
-with open("README.md", "r", encoding=utf_8.getregentry().name) as fhand:
+with open("README.md", "r", encoding="utf-8") as fhand:
     long_description = fhand.read()
 
 
 def get_packages_from_requierements_file() -> List[str]:
-    with open("requirements.txt", "r", encoding=utf_8.getregentry().name) as f:
+    with open("requirements.txt", "r", encoding="utf-8") as f:
         contents = f.read()
     return contents.strip().split("\n")
 
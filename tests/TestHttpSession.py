@@ -0,0 +1,60 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cmlutils.utils import call_api_v1, call_api_v2
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        # Record the client's source port: the same port across requests
+        # means the same TCP connection was reused.
+        self.server.client_ports.append(self.client_address[1])
+        body = json.dumps({"ok": True}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpSession(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        self.server.client_ports = []
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.host = "http://127.0.0.1:%d" % self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def test_second_call_reuses_connection(self):
+        first = call_api_v2(
+            host=self.host, endpoint="/api/v2/a", method="GET", user_token="t"
+        )
+        second = call_api_v2(
+            host=self.host, endpoint="/api/v2/b", method="GET", user_token="t"
+        )
+        self.assertEqual(first.json(), {"ok": True})
+        self.assertEqual(second.json(), {"ok": True})
+        self.assertEqual(len(self.server.client_ports), 2)
+        self.assertEqual(self.server.client_ports[0], self.server.client_ports[1])
+
+    def test_v1_and_v2_share_connection_pool(self):
+        call_api_v1(host=self.host, endpoint="/api/v1/a", method="GET", api_key="k")
+        call_api_v2(host=self.host, endpoint="/api/v2/a", method="GET", user_token="t")
+        self.assertEqual(len(self.server.client_ports), 2)
+        self.assertEqual(self.server.client_ports[0], self.server.client_ports[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
